@@ -1,4 +1,6 @@
 import re
+from array import array
+from bisect import bisect_left
 
 # ---------------------------------------------------------------------------
 # Human‑friendly explanations for common JSON parsing errors.
@@ -22,6 +24,15 @@ ERROR_EXPLANATIONS = {
     "quote": "Unexpected quote `\"`: string might not be closed properly.",
 }
 
+# Characters shown either side of the error when the offending line is
+# long, e.g. minified JSON that sits on a single line
+ERROR_CONTEXT = 200
+
+# Patterns used to pick details out of pyjson5 error messages
+_EXPECTED_RE = re.compile(r"expected b'([^']+)'")
+_NEAR_RE = re.compile(r"near\s+(\d+)")
+_CHAR_RE = re.compile(r"char\s+(\d+)")
+
 
 def _friendly_message(msg: str) -> str:
     """
@@ -45,14 +56,66 @@ def _friendly_message(msg: str) -> str:
             return explanation
 
     # Handle generic "Expected b'XYZ'" messages
-    m = re.search(r"expected b'([^']+)'", lower)
+    m = _EXPECTED_RE.search(lower)
     if m:
         return f"Unexpected token: expected `{m.group(1)}`."
 
     return msg
 
 
-def pretty_json_error(input_string: str, error: Exception):
+def line_offsets(input_string: str) -> array:
+    """
+    Build a table of the offsets of every newline in `input_string`.
+
+    The table can be passed to `pretty_json_error` when several positions
+    in the same text need resolving, so the text is only scanned once.
+
+    Parameters
+    ----------
+    input_string : str
+        The JSON text to index.
+
+    Returns
+    -------
+    array
+        Sorted offsets of each "\\n" character.
+    """
+    offsets = array("q")
+    i = input_string.find("\n")
+    while i != -1:
+        offsets.append(i)
+        i = input_string.find("\n", i + 1)
+    return offsets
+
+
+def _line_bounds(input_string: str, pos: int, offsets=None):
+    """
+    Locate the line containing character `pos`.
+
+    Returns
+    -------
+    tuple
+        (line number starting at 1, offset of line start, offset of line end)
+    """
+    if offsets is None:
+        # str.find, str.rfind and str.count scan in C without splitting
+        # the whole input into lines.
+        line_no = input_string.count("\n", 0, pos) + 1
+        line_start = input_string.rfind("\n", 0, pos) + 1
+        line_end = input_string.find("\n", pos)
+    else:
+        # Number of newlines strictly before `pos`
+        n = bisect_left(offsets, pos)
+        line_no = n + 1
+        line_start = offsets[n - 1] + 1 if n else 0
+        line_end = offsets[n] if n < len(offsets) else -1
+
+    if line_end == -1:
+        line_end = len(input_string)
+    return line_no, line_start, line_end
+
+
+def pretty_json_error(input_string: str, error: Exception, offsets=None):
     """
     Produce a detailed, user‑friendly JSON error message including:
       - a readable explanation
@@ -65,6 +128,9 @@ def pretty_json_error(input_string: str, error: Exception):
         The original JSON text the user attempted to parse.
     error : Exception
         The exception raised by pyjson5.
+    offsets : array, optional
+        Newline offsets from `line_offsets(input_string)`. Callers resolving
+        several errors in the same text can build this once and reuse it.
 
     Returns
     -------
@@ -81,12 +147,12 @@ def pretty_json_error(input_string: str, error: Exception):
     pos = getattr(error, "pos", None)
 
     if pos is None:
-        m = re.search(r"near\s+(\d+)", msg)
+        m = _NEAR_RE.search(msg)
         if m:
             pos = int(m.group(1))
 
     if pos is None:
-        m = re.search(r"char\s+(\d+)", msg)
+        m = _CHAR_RE.search(msg)
         if m:
             pos = int(m.group(1))
 
@@ -97,21 +163,22 @@ def pretty_json_error(input_string: str, error: Exception):
     # -----------------------------------------------------------------------
     # Convert character index → (line, column)
     # -----------------------------------------------------------------------
-    lines = input_string.splitlines()
-    running = 0
-
-    for i, line in enumerate(lines, start=1):
-        # If the error position falls within this line
-        if running + len(line) + 1 > pos:
-            col = pos - running
-            break
-        running += len(line) + 1
-    else:
+    if pos > len(input_string):
         # Position outside input — fallback
         return msg
 
+    i, line_start, line_end = _line_bounds(input_string, pos, offsets)
+    col = pos - line_start
+
+    # Only show the part of the line around the error
+    shown_start = max(line_start, pos - ERROR_CONTEXT)
+    shown_end = min(line_end, pos + ERROR_CONTEXT)
+    prefix = "..." if shown_start > line_start else ""
+    suffix = "..." if shown_end < line_end else ""
+    line = prefix + input_string[shown_start:shown_end].rstrip("\r") + suffix
+
     # Visual pointer under the offending character
-    pointer = " " * col + "^"
+    pointer = " " * (len(prefix) + pos - shown_start) + "^"
 
     explanation = _friendly_message(msg)
 
@@ -121,6 +188,6 @@ def pretty_json_error(input_string: str, error: Exception):
     return (
         f"{explanation}\n"
         f"Line {i}, column {col}:\n"
-        f"    {lines[i-1]}\n"
+        f"    {line}\n"
         f"    {pointer}"
     )
@@ -1,10 +1,18 @@
+from collections import OrderedDict
+from functools import wraps
+from hashlib import blake2b
+from threading import Lock
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 import pyjson5
 from pydantic import BaseModel
 from .json_error_to_english import pretty_json_error
 
 router = APIRouter()
 
+# Number of validation responses remembered per endpoint
+CACHE_SIZE = 128
+
 
 class InputModel(BaseModel):
     """
@@ -18,57 +26,121 @@ class InputModel(BaseModel):
     input_string: str
 
 
-@router.post("/room")
-def room(payload: InputModel):
+def _digest_cache(validate):
     """
-    Validate room JSON submitted by the frontend.
+    Cache the responses of a validator, like `functools.lru_cache`.
 
-    This endpoint performs two layers of validation:
-      1. Parse the input using pyjson5 (allows comments, trailing commas, etc.)
+    The key is a blake2b digest of the input text rather than the text itself,
+    so remembered responses do not keep large payloads alive.
+    """
+    cache = OrderedDict()
+    lock = Lock()
 
-    Returns
-    -------
-    dict
-        { "success": True } if valid,
-        { "success": False, "message": <error> } if invalid.
+    @wraps(validate)
+    def cached(input_string: str, detail: bool = True) -> dict:
+        key = (blake2b(input_string.encode("utf-8", "surrogatepass"), digest_size=16).digest(), detail)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        response = validate(input_string, detail)
+
+        with lock:
+            cache[key] = response
+            if len(cache) > CACHE_SIZE:
+                cache.popitem(last=False)
+        return response
+
+    return cached
+
+
+@_digest_cache
+def _validate_room(input_string: str, detail: bool = True) -> dict:
     """
-    input_string = payload.input_string
+    Parse and validate room JSON, returning the endpoint response.
 
+    This is plain synchronous work so that `room` can hand it to a worker
+    thread and keep the event loop free while large inputs are parsed.
+    Results are cached by a digest of the input text, as the editor tends
+    to resubmit the same JSON repeatedly.
+    """
     # Step 1: JSON parsing (with helpful error messages)
     try:
         data = pyjson5.loads(input_string)
         return {"success": True}
     except Exception as e:
+        if not detail:
+            return {"success": False}
         return {
             "success": False,
             "message": pretty_json_error(input_string, e)
         }
 
 
-
-@router.post("/wind")
-def wind(payload: InputModel):
+@_digest_cache
+def _validate_wind(input_string: str, detail: bool = True) -> dict:
     """
-    Validate wind JSON submitted by the frontend.
-
-    Follows the same two‑stage validation process as /room:
-      1. Parse JSON using pyjson5
+    Parse and validate wind JSON, returning the endpoint response.
 
-    Returns
-    -------
-    dict
-        { "success": True } if valid,
-        { "success": False, "message": <error> } if invalid.
+    Synchronous counterpart of `wind`, run in a worker thread and cached
+    like `_validate_room`.
     """
-    input_string = payload.input_string
-
     # Step 1: JSON parsing
     try:
         data = pyjson5.loads(input_string)
         return {"success": True}
     except Exception as e:
+        if not detail:
+            return {"success": False}
         return {
             "success": False,
             "message": pretty_json_error(input_string, e)
         }
 
+
+@router.post("/room")
+async def room(payload: InputModel, detail: bool = True):
+    """
+    Validate room JSON submitted by the frontend.
+
+    This endpoint performs two layers of validation:
+      1. Parse the input using pyjson5 (allows comments, trailing commas, etc.)
+
+    Parameters
+    ----------
+    detail : bool, optional
+        Query parameter; when False a failed parse returns no message,
+        skipping the error formatting for callers that only need the result.
+
+    Returns
+    -------
+    dict
+        { "success": True } if valid,
+        { "success": False, "message": <error> } if invalid
+        ({ "success": False } if `detail` is False).
+    """
+    return await run_in_threadpool(_validate_room, payload.input_string, detail)
+
+
+@router.post("/wind")
+async def wind(payload: InputModel, detail: bool = True):
+    """
+    Validate wind JSON submitted by the frontend.
+
+    Follows the same two‑stage validation process as /room:
+      1. Parse JSON using pyjson5
+
+    Parameters
+    ----------
+    detail : bool, optional
+        Query parameter; when False a failed parse returns no message.
+
+    Returns
+    -------
+    dict
+        { "success": True } if valid,
+        { "success": False, "message": <error> } if invalid
+        ({ "success": False } if `detail` is False).
+    """
+    return await run_in_threadpool(_validate_wind, payload.input_string, detail)
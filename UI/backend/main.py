@@ -19,5 +19,11 @@ app.mount("/", StaticFiles(directory=frontend_path, html=True), name="static")
 
 
 def is_port_free(port):
+    # Binding (without SO_REUSEADDR) fails straight away if anything holds the port,
+    # without the connection attempt that probing with connect_ex needs
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('127.0.0.1', port)) != 0
+        try:
+            s.bind(('127.0.0.1', port))
+        except OSError:
+            return False
+        return True
@@ -1,5 +1,8 @@
 from fastapi import APIRouter, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from functools import reduce
 import pickle
+import numpy as np
 import pandas as pd
 
 router = APIRouter()
@@ -7,6 +10,15 @@ router = APIRouter()
 # Global in‑memory store for loaded simulation results.
 results = {}
 
+# Per room lookup tables precomputed at load, so that queries avoid
+# pandas label indexing:
+#   species_by_room: { roomName: { species: column position } }
+#   times_by_room:   { roomName: (sorted times, row order) from time_index }
+#   arrays_by_room:  { roomName: [numpy array of each column] }
+species_by_room = {}
+times_by_room = {}
+arrays_by_room = {}
+
 
 def intersect(*d):
     """
@@ -22,19 +34,65 @@ def intersect(*d):
     set
         The set of elements common to all iterables.
     """
-    sets = iter(map(set, d))
-    result = next(sets)
-    for s in sets:
-        result = result.intersection(s)
-    return result
+    return set(d[0]).intersection(*d[1:])
+
+
+def time_index(index):
+    """
+    Prepare the time index of a room for binary search.
+
+    Parameters
+    ----------
+    index : pandas.Index
+        Time index of a single room, which may be unsorted or contain
+        repeated times.
+
+    Returns
+    -------
+    tuple
+        (times sorted ascending as a numpy array,
+         the row of each sorted time, or None when the index is already sorted)
+    """
+    times = index.to_numpy()
+    if index.is_monotonic_increasing:
+        return times, None
+    # A stable sort keeps repeated times in their original row order
+    order = np.argsort(times, kind="stable")
+    return times[order], order
+
+
+def find_rows(times, time):
+    """
+    Find the rows of a room recorded at the given time.
+
+    Parameters
+    ----------
+    times : tuple
+        The room's entry in `times_by_room`, as built by `time_index`.
+    time : float
+        Time to look up.
+
+    Returns
+    -------
+    tuple or None
+        (first row, last row) recorded at `time`, or None if there are none.
+    """
+    sorted_times, order = times
+    first = np.searchsorted(sorted_times, time, "left")
+    if first == len(sorted_times) or sorted_times[first] != time:
+        return None
+    last = np.searchsorted(sorted_times, time, "right") - 1
+    if order is not None:
+        return order[first], order[last]
+    return first, last
 
 
 @router.post("/load")
 async def load(file: UploadFile = File(...)):
     """
-    Load a pickled results file uploaded from the frontend.
+    Load a results file uploaded from the frontend.
 
-    The file is expected to contain a dictionary:
+    A pickle file is expected to contain a dictionary:
         { roomName: pandas.DataFrame }
 
     Each DataFrame:
@@ -42,6 +100,15 @@ async def load(file: UploadFile = File(...)):
         - has columns representing species
         - contains numeric values
 
+    Parquet (.parquet) and Feather (.feather) files instead hold all rooms
+    in one table, with "room" and "time" as index levels or columns, e.g.
+        table = pd.concat(results, names=["room", "time"])
+        table.attrs["species"] = {room: list(data.columns) for room, data in results.items()}
+        table.to_parquet(path)
+    The "species" attribute, kept in the file's metadata, lists the columns
+    of each room. Without it, columns that are all NaN for a room are taken
+    to be species of other rooms and dropped.
+
     Returns
     -------
     dict
@@ -51,20 +118,57 @@ async def load(file: UploadFile = File(...)):
             "intersecting_times": [sorted list of times present in all rooms]
         }
     """
-    global results
-
-    # Read raw bytes from uploaded file
-    contents = await file.read()
-
-    # Unpickle into Python objects
-    results = pickle.loads(contents)
+    global results, species_by_room, times_by_room, arrays_by_room
+
+    filename = (file.filename or "").lower()
+
+    if filename.endswith((".parquet", ".feather")):
+        reader = pd.read_parquet if filename.endswith(".parquet") else pd.read_feather
+        table = await run_in_threadpool(reader, file.file)
+
+        # Feather cannot store an index, so room and time arrive as columns
+        if not isinstance(table.index, pd.MultiIndex):
+            table = table.set_index(["room", "time"])
+
+        # Split back into one frame per room, keeping only that room's species
+        species = table.attrs.get("species")
+        results = {}
+        for room, data in table.groupby(level="room", sort=False):
+            data = data.droplevel("room")
+            if species is not None:
+                results[room] = data[species[room]]
+            else:
+                # The all-NaN columns of a room are assumed to belong to other
+                # rooms, which also drops a species a room records as all NaN
+                results[room] = data.dropna(axis=1, how="all")
+
+        # The per room frames are copies, so the stacked table can go
+        del table
+    else:
+        # Read raw bytes from uploaded file
+        contents = await file.read()
+
+        # Unpickle into Python objects
+        results = pickle.loads(contents)
+
+    species_by_room = {
+        room: {species: i for i, species in enumerate(data.columns)}
+        for room, data in results.items()
+    }
+    times_by_room = {room: time_index(data.index) for room, data in results.items()}
+    # One array per column, so columns of different dtypes are neither
+    # copied into a common array nor converted
+    arrays_by_room = {
+        room: [column.to_numpy() for _, column in data.items()]
+        for room, data in results.items()
+    }
 
     # Extract time indices for each room
     times = [data.index for _, data in results.items()]
 
     # Compute times that exist in *all* rooms
-    intersecting_times = list(set(times[0]).intersection(*times))
-    intersecting_times.sort()
+    intersecting_times = reduce(pd.Index.intersection, times[1:], times[0].unique())
+    intersecting_times = intersecting_times.sort_values().tolist()
 
     return {
         "status": "success",
@@ -83,10 +187,10 @@ async def check_species(species: str):
     dict
         { roomName: True/False }
     """
-    global results
+    global species_by_room
     return {
-        room: (species in data.keys())
-        for room, data in results.items()
+        room: (species in s)
+        for room, s in species_by_room.items()
     }
 
 
@@ -100,10 +204,10 @@ async def check_time(time: float):
     dict
         { roomName: True/False }
     """
-    global results
+    global times_by_room
     return {
-        room: (time in data.index)
-        for room, data in results.items()
+        room: (find_rows(t, time) is not None)
+        for room, t in times_by_room.items()
     }
 
 
@@ -117,15 +221,15 @@ async def range(species: str):
     dict
         { roomName: (minValue, maxValue) }
     """
-    global results
+    global results, species_by_room
 
-    def result(data):
-        if species not in data.keys():
+    def result(room, data):
+        if species not in species_by_room[room]:
             return (None, None)
         return (data[species].min(), data[species].max())
 
     return {
-        room: result(data)
+        room: result(room, data)
         for room, data in results.items()
     }
 
@@ -139,8 +243,7 @@ async def values(
     """
     Retrieve the value of a species at a given time for each room.
 
-    If the value at that time is a pandas.Series (e.g., multiple
-    values recorded at the same timestamp), then:
+    If multiple values are recorded at the same timestamp, then:
         - last_value=True → return the last entry
         - last_value=False → return the first entry
 
@@ -149,23 +252,23 @@ async def values(
     dict
         { roomName: numericValue }
     """
-    global results
+    global species_by_room, times_by_room, arrays_by_room
 
-    # Choose which element to extract if a Series is returned
-    location = -1 if last_value else 0
+    # Choose which row to read if the time appears more than once
+    location = 1 if last_value else 0
 
-    def result(data):
-        if species not in data.keys():
+    def result(room):
+        column = species_by_room[room].get(species)
+        rows = find_rows(times_by_room[room], time)
+        if column is None or rows is None:
             return None
-        s = data[species]
-        if time not in s:
-            return None
-        val = s[time]
-        return val.iloc[location] if isinstance(val, pd.Series) else val
+        value = arrays_by_room[room][column][rows[location]]
+        # numpy scalars are returned as plain Python numbers, keeping ints as ints
+        return value.item() if isinstance(value, np.generic) else value
 
     result_dict = {
-        room: result(data)
-        for room, data in results.items()
+        room: result(room)
+        for room in species_by_room
     }
 
     return result_dict
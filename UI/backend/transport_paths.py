@@ -1,8 +1,6 @@
 # This is a duplicate of the methods in `multiroom_model.transport_paths` for use in the UI
 
-from typing import List,  Dict, Union, TypeVar
-from dataclasses import dataclass
-from itertools import combinations
+from typing import List,  Dict, Tuple, Union, TypeVar
 from collections import namedtuple
 
 Side = str
@@ -26,62 +24,67 @@ def paths_through_building(rooms: List[Room], apertures: List[Aperture]) -> List
         @brief Given a list of rooms and a list of apertures joining them (either to each other or the outside)
         Produces a list of the unique transport paths from one outside side of the house to another
         Each path goes through each room only once, preventing cycles
+        (so an aperture joining a room to itself is never part of a path)
         Note that a path and its exact reversal are NOT both in the list, this is to prevent double-counting paths.
     """
 
     # build a graph where nodes are either rooms or outsides, and edges are apertures
-    @dataclass
-    class Node:
-        item: Union[Room | Side]
-        edges: List
-
-    @dataclass
-    class Edge:
-        source: Node
-        destination: Node
-        aperture: TransportPathParticipation
-
-    graph: Dict[Union[Room | Side], Node] = {}
-    for s in outsides:
-        graph[s] = Node(item=s, edges=[])
-    for r in rooms:
-        graph[r] = Node(item=r, edges=[])
+    # nodes are numbered (outsides first) and each has a list of (destination, participation) edges
+    items: List[Union[Room | Side]] = list(outsides) + list(rooms)
+    node_index: Dict[Union[Room | Side], int] = {item: i for i, item in enumerate(items)}
+    edges: List[List[Tuple[int, TransportPathParticipation]]] = [[] for _ in items]
+
+    # we don't want to be able to leave the building and reenter it
+    # so outside nodes are tagged and never entered unless they end the path
+    is_outside = bytearray(len(items))
+    is_outside[:len(outsides)] = b"\x01" * len(outsides)
 
     for a in apertures:
-        node_1: Node = graph[a.origin]
-        node_2: Node = graph[a.destination]
-        node_1.edges.append(Edge(source=node_1, destination=node_2, aperture=TransportPathParticipation(a, False)))
-        node_2.edges.append(Edge(source=node_2, destination=node_1, aperture=TransportPathParticipation(a, True)))
-
-    # method to find all the paths from one start node to an end node
-
-    def all_paths_between(start_node, end_node) -> List[TransportPath]:
-        result: List[TransportPath] = []
-
-        # recursive utility function
-        def find_all_paths(current_node: Node, final_destination: Node, visited: List[Node], path: List[TransportPathParticipation]):
-            new_visited = visited + [current_node]
-            for edge in current_node.edges:
-                new_path = path + [edge.aperture]
-                if (edge.destination == final_destination):
-                    result.append(TransportPath(start=start_node.item, end=end_node.item, route=new_path))
-                elif (edge.destination not in visited):
-                    find_all_paths(edge.destination, final_destination, new_visited, new_path)
-
-        # we don't want to be able to leave the building and reenter it
-        # exclude the outside nodes from path
-        excluded_nodes = list(graph[s] for s in outsides)
-
-        # invoke the recursive function
-        find_all_paths(start_node, end_node, excluded_nodes, [])
+        node_1 = node_index[a.origin]
+        node_2 = node_index[a.destination]
+        edges[node_1].append((node_2, TransportPathParticipation(a, False)))
+        edges[node_2].append((node_1, TransportPathParticipation(a, True)))
+
+    # method to find all the paths from one start node to each of the outside nodes after it
+    # which covers every combination of 2 of the outside nodes (there are 6 combinations: 4C2=6)
+    # We don't use permutations, because that would double-count the paths by reversing the start and end
+
+    def all_paths_from(start_node: int) -> Dict[int, List[TransportPath]]:
+        result: Dict[int, List[TransportPath]] = {end_node: [] for end_node in range(start_node + 1, len(outsides))}
+
+        visited = bytearray(len(items))
+        path: List[TransportPathParticipation] = []
+
+        # iterative depth first search, the stack holds each node on the current path
+        # along with an iterator over the edges of it that are still to be explored
+        stack = [(start_node, iter(edges[start_node]))]
+        while stack:
+            current_node, remaining = stack[-1]
+            edge = next(remaining, None)
+            if edge is None:
+                # every edge explored, step back out of this node
+                stack.pop()
+                if stack:
+                    visited[current_node] = 0
+                    path.pop()
+                continue
+
+            destination, aperture = edge
+            if is_outside[destination]:
+                if destination in result:
+                    result[destination].append(TransportPath(start=items[start_node], end=items[destination], route=path + [aperture]))
+            elif not visited[destination]:
+                visited[destination] = 1
+                path.append(aperture)
+                stack.append((destination, iter(edges[destination])))
+
         return result
 
-    # Use this method 6 times to accumulate all routes between the 4 outside nodes, and not their exact reversals
+    # Search once from each outside node to accumulate all routes between the 4 outside nodes,
+    # and not their exact reversals, grouped in the order of combinations(outsides, 2)
     result: List[TransportPath] = []
-
-    # Use all combinations of 2 of the outside nodes (there are 6 combinations of 2 outside nodes: 4C2=6)
-    # We don't use permutations, because that would double-count the paths by reversing the start and end
-    for start, end in combinations(outsides, 2):
-        result.extend(all_paths_between(graph[start], graph[end]))
+    for start_node in range(len(outsides)):
+        for routes in all_paths_from(start_node).values():
+            result.extend(routes)
 
     return result
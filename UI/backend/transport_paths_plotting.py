@@ -1,10 +1,23 @@
+from functools import lru_cache
+import json
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from .transport_paths import paths_through_building, Room, Aperture, outsides
-from typing import List
+from typing import Iterator, List, Tuple
+
+# orjson is optional; fall back to the stdlib encoder without it
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 router = APIRouter()
 
+# Number of routes encoded into each chunk of the streamed response
+ROUTES_PER_CHUNK = 1000
+
 
 # Pydantic models to act as FastAPI request payloads
 class InputAperture(BaseModel):
@@ -16,6 +29,37 @@ class InputModel(BaseModel):
 
 
 
+@lru_cache(maxsize=4)
+def _aperture_routes(rooms: Tuple[Room, ...], apertures: Tuple[Aperture, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Compute the transport paths for a layout as tuples of aperture IDs.
+
+    Rooms and apertures are namedtuples, so the layout itself is hashable
+    and serves as the cache key; resubmitting an unchanged layout skips
+    the path search entirely. The frontend only ever sends its current
+    layout, so only a few are kept, as each can hold many routes.
+    """
+    transport_paths = paths_through_building(rooms, apertures)
+    return tuple(
+        tuple(p.aperture.id for p in t.route)
+        for t in transport_paths
+    )
+
+
+def _stream_routes(routes: Tuple[Tuple[str, ...], ...]) -> Iterator[bytes]:
+    """
+    Encode routes as a JSON array of aperture ID lists, chunk by chunk.
+
+    Only one chunk of encoded routes is held in memory at a time, rather
+    than the whole response body.
+    """
+    yield b"["
+    for i in range(0, len(routes), ROUTES_PER_CHUNK):
+        if i:
+            yield b","
+        yield b",".join(_dumps(route) for route in routes[i:i + ROUTES_PER_CHUNK])
+    yield b"]"
+
 
 @router.post("/paths")
 def paths(payload: InputModel):
@@ -34,7 +78,7 @@ def paths(payload: InputModel):
     -------
     List[List[str]]
         A list of transport paths, where each path is represented
-        as a list of aperture IDs in traversal order.
+        as a list of aperture IDs in traversal order, streamed as JSON.
     """
     rooms = {}       # name → MockRoom
     apertures = {}   # id → MockAperture
@@ -43,20 +87,13 @@ def paths(payload: InputModel):
     for a in payload.apertures:
 
         # Ensure origin room exists
-        if a.origin in rooms:
-            origin = rooms[a.origin]
-        else:
-            origin = Room(name=a.origin)
-            rooms[a.origin] = origin
+        origin = rooms.setdefault(a.origin, Room(name=a.origin))
 
         # Destination may be a room or an outside direction
         if a.destination in outsides:
             destination = outsides[a.destination]
-        elif a.destination in rooms:
-            destination = rooms[a.destination]
         else:
-            destination = Room(name=a.destination)
-            rooms[a.destination] = destination
+            destination = rooms.setdefault(a.destination, Room(name=a.destination))
 
         # Create aperture edge
         apertures[a.id] = Aperture(
@@ -65,14 +102,10 @@ def paths(payload: InputModel):
             id=a.id
         )
 
-    # Compute transport paths using the solver
-    transport_paths = paths_through_building(
-        rooms.values(),
-        apertures.values()
+    # Compute transport paths using the solver (cached per layout)
+    routes = _aperture_routes(
+        tuple(rooms.values()),
+        tuple(apertures.values())
     )
 
-    # Extract ordered aperture IDs from solver output
-    routes = [t.route for t in transport_paths]
-    result = [[p.aperture.id for p in route] for route in routes]
-
-    return result
+    return StreamingResponse(_stream_routes(routes), media_type="application/json")